@@ -54,7 +54,9 @@ def model_analyzer(
     # raw predictions for validation dataset
     args = {} if not is_classification else {"predict_proba": True}
     normal_predictions = predictor(encoded_val_data, args=PredictionArguments.from_dict(args))
-    normal_predictions = normal_predictions.set_index(data.index)
+    # predictions come back in row order, so swapping the index in place aligns
+    # them with the validation frame without copying the whole frame
+    normal_predictions.index = data.index
 
     # ------------------------- #
     # Run analysis blocks, both core and user-defined
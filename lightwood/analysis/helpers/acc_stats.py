@@ -44,22 +44,23 @@ class AccStats(BaseAnalysisBlock):
         self.real_values_bucketized = []
         self.numerical_samples_arr = []
 
-        for n in range(len(ns.normal_predictions)):
-            row = ns.data.iloc[n]
-            real_value = row[self.target]
-            predicted_value = ns.normal_predictions.iloc[n]['prediction']
+        # materialize row values once upfront; per-row .iloc access allocates a Series each call
+        is_numerical_target = self.col_stats[self.target] in [dtype.integer, dtype.float, dtype.quantity]
+        real_values = ns.data[self.target].tolist()
+        predicted_values = ns.normal_predictions['prediction'].tolist()
+        if conf is not None and is_numerical_target:
+            predicted_ranges = conf[['lower', 'upper']].to_numpy().tolist()
+        else:
+            predicted_ranges = None
 
+        for n, (real_value, predicted_value) in enumerate(zip(real_values, predicted_values)):
             if isinstance(predicted_value, list):
                 # T+N time series, for now we compare the T+1 prediction only @TODO: generalize
                 predicted_value = predicted_value[0]
 
-            predicted_value = predicted_value \
-                if self.col_stats[self.target] not in [dtype.integer, dtype.float, dtype.quantity] \
-                else float(predicted_value)
-
-            real_value = real_value \
-                if self.col_stats[self.target] not in [dtype.integer, dtype.float, dtype.quantity] \
-                else float(real_value)
+            if is_numerical_target:
+                predicted_value = float(predicted_value)
+                real_value = float(real_value)
 
             if self.buckets:
                 bucket = self.buckets[self.target]
@@ -69,15 +70,10 @@ class AccStats(BaseAnalysisBlock):
                 predicted_value_b = predicted_value
                 real_value_b = real_value
 
-            if conf is not None and self.col_stats[self.target] in [dtype.integer, dtype.float, dtype.quantity]:
-                predicted_range = conf.iloc[n][['lower', 'upper']].tolist()
-            else:
-                predicted_range = (predicted_value_b, predicted_value_b)
-
             self.real_values_bucketized.append(real_value_b)
             self.normal_predictions_bucketized.append(predicted_value_b)
-            if conf is not None and self.col_stats[self.target] in [dtype.integer, dtype.float, dtype.quantity]:
-                self.numerical_samples_arr.append((real_value, predicted_range))
+            if predicted_ranges is not None:
+                self.numerical_samples_arr.append((real_value, predicted_ranges[n]))
 
     def get_accuracy_stats(self, is_classification=None, is_numerical=None):
         bucket_accuracy = {}
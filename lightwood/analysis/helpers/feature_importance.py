@@ -4,8 +4,10 @@ from typing import Dict
 
 import torch
 import numpy as np
+import pandas as pd
 
 from lightwood.analysis.base import BaseAnalysisBlock
+from lightwood.data.encoded_ds import EncodedDs
 from lightwood.helpers.general import evaluate_accuracy
 from lightwood.analysis.nc.util import t_softmax
 from lightwood.api.types import PredictionArguments
@@ -29,6 +31,7 @@ class GlobalFeatureImportance(BaseAnalysisBlock):
     def __init__(self, disable_column_importance):
         super().__init__()
         self.disable_column_importance = disable_column_importance
+        self.max_batched_rows = int(1e5)  # above this, column ablations are predicted one at a time
 
     def analyze(self, info: Dict[str, object], **kwargs) -> Dict[str, object]:
         ns = SimpleNamespace(**kwargs)
@@ -36,24 +39,49 @@ class GlobalFeatureImportance(BaseAnalysisBlock):
         if self.disable_column_importance or ns.tss.is_timeseries or ns.has_pretrained_text_enc:
             info['column_importances'] = None
         else:
-            empty_input_accuracy = {}
             ignorable_input_cols = [x for x in ns.input_cols if (not ns.tss.is_timeseries or
                                                                  (x not in ns.tss.order_by and
                                                                   x not in ns.tss.historical_columns))]
-            for col in ignorable_input_cols:
-                partial_data = deepcopy(ns.encoded_val_data)
-                partial_data.clear_cache()
-                partial_data.data_frame[col] = [None] * len(partial_data.data_frame[col])
-
-                args = {'predict_proba': True} if ns.is_classification else {}
-                empty_input_preds = ns.predictor(partial_data, args=PredictionArguments.from_dict(args))
-
-                empty_input_accuracy[col] = np.mean(list(evaluate_accuracy(
-                    ns.data,
-                    empty_input_preds['prediction'],
-                    ns.target,
-                    ns.accuracy_functions
-                ).values()))
+            args = {'predict_proba': True} if ns.is_classification else {}
+            nr_rows = len(ns.encoded_val_data.data_frame)
+
+            empty_input_accuracy = {}
+            if 0 < nr_rows * len(ignorable_input_cols) <= self.max_batched_rows:
+                # stack one column-ablated copy of the validation frame per input column and
+                # run a single predictor call, instead of one call per column
+                blocks = []
+                for col in ignorable_input_cols:
+                    block = ns.encoded_val_data.data_frame.copy(deep=False)
+                    block[col] = [None] * nr_rows
+                    blocks.append(block)
+
+                batched_ds = EncodedDs(ns.encoded_val_data.encoders,
+                                       pd.concat(blocks, ignore_index=True),
+                                       ns.target)
+                batched_preds = ns.predictor(batched_ds, args=PredictionArguments.from_dict(args))
+
+                for i, col in enumerate(ignorable_input_cols):
+                    col_preds = batched_preds['prediction'].iloc[i * nr_rows:(i + 1) * nr_rows]
+                    empty_input_accuracy[col] = np.mean(list(evaluate_accuracy(
+                        ns.data,
+                        col_preds.reset_index(drop=True),
+                        ns.target,
+                        ns.accuracy_functions
+                    ).values()))
+            else:
+                for col in ignorable_input_cols:
+                    partial_data = deepcopy(ns.encoded_val_data)
+                    partial_data.clear_cache()
+                    partial_data.data_frame[col] = [None] * len(partial_data.data_frame[col])
+
+                    empty_input_preds = ns.predictor(partial_data, args=PredictionArguments.from_dict(args))
+
+                    empty_input_accuracy[col] = np.mean(list(evaluate_accuracy(
+                        ns.data,
+                        empty_input_preds['prediction'],
+                        ns.target,
+                        ns.accuracy_functions
+                    ).values()))
 
             column_importances = {}
             acc_increases = []
@@ -1,5 +1,4 @@
 from copy import deepcopy
-from itertools import product
 from typing import Dict, Tuple
 from types import SimpleNamespace
 
@@ -17,7 +16,7 @@ from lightwood.analysis.nc.norm import Normalizer
 from lightwood.analysis.nc.icp import IcpRegressor, IcpClassifier
 from lightwood.analysis.nc.base import CachedRegressorAdapter, CachedClassifierAdapter
 from lightwood.analysis.nc.nc import BoostedAbsErrorErrFunc, RegressorNc, ClassifierNc, MarginErrFunc
-from lightwood.analysis.nc.util import clean_df, set_conf_range, get_numeric_conf_range, \
+from lightwood.analysis.nc.util import clean_df, to_icp_matrix, set_conf_range, get_numeric_conf_range, \
     get_categorical_conf, get_anomalies
 
 
@@ -102,7 +101,9 @@ class ICP(BaseAnalysisBlock):
                         preds = icp.nc_function.model.prediction_cache
                     else:
                         preds = ns.normal_predictions['prediction']
-                    predicted_classes = pd.get_dummies(preds).values  # inflate to one-hot enc
+                    # inflate to one-hot enc with the fitted encoder, so that column
+                    # order is guaranteed to match the class map
+                    predicted_classes = enc.transform(np.asarray(preds).reshape(-1, 1))
                     icp.nc_function.model.prediction_cache = predicted_classes
 
             elif ns.is_multi_ts:
@@ -117,20 +118,28 @@ class ICP(BaseAnalysisBlock):
             # fit additional ICPs in time series tasks with grouped columns
             if ns.tss.is_timeseries and ns.tss.group_by:
 
-                # create an ICP for each possible group
+                # create an ICP for each observed group; unobserved combinations of the
+                # grouping values have no calibration data, so they are never spawned
                 group_info = ns.data[ns.tss.group_by].to_dict('list')
-                all_group_combinations = list(product(*[set(x) for x in group_info.values()]))
+                all_group_combinations = list(
+                    ns.data[ns.tss.group_by].drop_duplicates().itertuples(index=False, name=None))
                 output['icp']['__mdb_groups'] = all_group_combinations
                 output['icp']['__mdb_group_keys'] = [x for x in group_info.keys()]
 
+                # building each group ICP from scratch is much cheaper than deep-copying
+                # the default one, as the underlying predictor and normalizer are shared
+                def _make_icp():
+                    group_nc = nc_class(adapter(ns.predictor), type(nc_function)(), normalizer=normalizer)
+                    return icp_class(group_nc, cal_size=self.validation_size)
+
                 for combination in all_group_combinations:
-                    output['icp'][frozenset(combination)] = deepcopy(icp)
+                    output['icp'][frozenset(combination)] = _make_icp()
 
-            # calibrate ICP
-            icp_df = deepcopy(ns.data)
+            # calibrate ICP; shallow copy suffices as calibration only drops columns
+            icp_df = ns.data.copy(deep=False)
             icp_df, y = clean_df(icp_df, ns.target, ns.is_classification, output.get('label_encoders', None))
             output['icp']['__default'].index = icp_df.columns
-            output['icp']['__default'].calibrate(icp_df.values, y)
+            output['icp']['__default'].calibrate(to_icp_matrix(icp_df), y)
 
             # get confidence estimation for validation dataset
             conf, ranges = set_conf_range(
@@ -150,46 +159,45 @@ class ICP(BaseAnalysisBlock):
                 icps = output['icp']
                 group_keys = icps['__mdb_group_keys']
 
-                # add all predictions to DF
-                icps_df = deepcopy(ns.data)
+                # keep predictions in a flat array, sliced per group, instead of
+                # round-tripping them through a DataFrame column pop per iteration
+                icps_df = ns.data.copy(deep=False)
                 if ns.is_multi_ts:
-                    icps_df[f'__predicted_{ns.target}'] = [p[0] for p in ns.normal_predictions['prediction']]
+                    pred_arr = np.array([p[0] for p in ns.normal_predictions['prediction']])
                 else:
-                    icps_df[f'__predicted_{ns.target}'] = ns.normal_predictions['prediction']
+                    pred_arr = np.asarray(ns.normal_predictions['prediction'])
 
-                for group in icps['__mdb_groups']:
-                    icp_df = icps_df
+                # hashed groupby gives every group's training std in one pass,
+                # instead of re-scanning the full frame per group
+                if not ns.is_classification:
+                    train_std_by_group = ns.data.groupby(group_keys, sort=False)[ns.target].std(ddof=0).to_dict()
 
-                    # filter irrelevant rows for each group combination
-                    icp_df['__mdb_norm_index'] = np.arange(len(icp_df))
-                    for key, val in zip(group_keys, group):
-                        icp_df = icp_df[icp_df[key] == val]
+                # row indices for every group come from one hashed pass; each group's
+                # frame is then materialized with a single take()
+                idx_by_group = icps_df.groupby(group_keys, sort=False).indices
+
+                for group in icps['__mdb_groups']:
+                    lookup = group if len(group) > 1 else group[0]
+                    group_rows = idx_by_group.get(lookup, np.empty(0, dtype=np.int64))
+                    icp_df = icps_df.take(group_rows)
 
                     if icps[frozenset(group)].nc_function.normalizer is not None:
                         group_normalizer = icps[frozenset(group)].nc_function.normalizer
-                        norm_input_df = ns.encoded_val_data.data_frame.iloc[icp_df.pop('__mdb_norm_index')]
+                        norm_input_df = ns.encoded_val_data.data_frame.iloc[group_rows]
                         norm_input = EncodedDs(ns.encoded_val_data.encoders, norm_input_df, ns.target)
                         norm_cache = group_normalizer(norm_input, args=PredictionArguments())
-                        icp_df[f'__norm_{ns.target}'] = norm_cache
+                        group_normalizer.prediction_cache = np.asarray(norm_cache)
 
                     # save relevant predictions in the caches, then calibrate the ICP
-                    pred_cache = icp_df.pop(f'__predicted_{ns.target}').values
-                    icps[frozenset(group)].nc_function.model.prediction_cache = pred_cache
+                    icps[frozenset(group)].nc_function.model.prediction_cache = pred_arr[group_rows]
                     icp_df, y = clean_df(icp_df, ns.target, ns.is_classification, output.get('label_encoders', None))
-                    if icps[frozenset(group)].nc_function.normalizer is not None:
-                        icps[frozenset(group)].nc_function.normalizer.prediction_cache = icp_df.pop(
-                            f'__norm_{ns.target}').values
 
                     icps[frozenset(group)].index = icp_df.columns  # important at inference time
-                    icps[frozenset(group)].calibrate(icp_df.values, y)
+                    icps[frozenset(group)].calibrate(to_icp_matrix(icp_df), y)
 
                     # save training std() for bounds width selection
                     if not ns.is_classification:
-                        icp_train_df = ns.data
-                        for key, val in zip(group_keys, group):
-                            icp_train_df = icp_train_df[icp_train_df[key] == val]
-                        y_train = icp_train_df[ns.target].values
-                        output['df_target_stddev'][frozenset(group)] = y_train.std()
+                        output['df_target_stddev'][frozenset(group)] = train_std_by_group.get(lookup, np.nan)
 
                     # get bounds for relevant rows in validation dataset
                     conf, group_ranges = set_conf_range(
@@ -278,7 +286,7 @@ class ICP(BaseAnalysisBlock):
                         for icol, cat_col in enumerate(all_cat_cols):
                             row_insights.loc[X.index, cat_col] = class_dists[:, icol]
                     else:
-                        class_dists = pd.get_dummies(preds).values
+                        class_dists = ns.analysis['label_encoders'].transform(np.asarray(preds).reshape(-1, 1))
 
                     base_icp.nc_function.model.prediction_cache = class_dists
 
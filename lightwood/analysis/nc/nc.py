@@ -105,12 +105,10 @@ class InverseProbabilityErrFunc(ClassificationErrFunc):
         super(InverseProbabilityErrFunc, self).__init__()
 
     def apply(self, prediction, y):
-        prob = np.zeros(y.size, dtype=np.float32)
-        for i, y_ in enumerate(y):
-            if y_ >= prediction.shape[1]:
-                prob[i] = 0
-            else:
-                prob[i] = prediction[i, int(y_)]
+        y_idx = np.asarray(y).astype(int)
+        prob = np.zeros(y_idx.size, dtype=np.float32)
+        rows = np.flatnonzero(y_idx < prediction.shape[1])
+        prob[rows] = prediction[rows, y_idx[rows]]
         return 1 - prob
 
 
@@ -128,14 +126,12 @@ class MarginErrFunc(ClassificationErrFunc):
         super(MarginErrFunc, self).__init__()
 
     def apply(self, prediction, y):
-        prediction = deepcopy(prediction).astype(float)
-        prob = np.zeros(y.size, dtype=np.float32)
-        for i, y_ in enumerate(y):
-            if y_ >= prediction.shape[1]:
-                prob[i] = 0
-            else:
-                prob[i] = prediction[i, int(y_)]
-                prediction[i, int(y_)] = -np.inf
+        prediction = np.array(prediction, dtype=float)
+        y_idx = np.asarray(y).astype(int)
+        prob = np.zeros(y_idx.size, dtype=np.float32)
+        rows = np.flatnonzero(y_idx < prediction.shape[1])
+        prob[rows] = prediction[rows, y_idx[rows]]
+        prediction[rows, y_idx[rows]] = -np.inf
         return 0.5 - ((prob - prediction.max(axis=1)) / 2)
 
 
@@ -155,11 +151,13 @@ class AbsErrorErrFunc(RegressionErrFunc):
         return np.abs(prediction - y)
 
     def apply_inverse(self, nc, significance):
-        nc = np.sort(nc)[::-1]
         border = int(np.floor(significance * (nc.size + 1))) - 1
         # TODO: should probably warn against too few calibration examples
         border = min(max(border, 0), nc.size - 1)
-        return np.vstack([nc[border], nc[border]])
+        # O(n) partial selection of the border-th largest score, instead of a full sort
+        kth = nc.size - 1 - border
+        quantile = np.partition(nc, kth)[kth]
+        return np.vstack([quantile, quantile])
 
 
 class BoostedAbsErrorErrFunc(RegressionErrFunc):
@@ -174,14 +172,19 @@ class BoostedAbsErrorErrFunc(RegressionErrFunc):
         return np.abs(prediction - y)
 
     def apply_inverse(self, nc, significance):
-        nc = np.sort(nc)[::-1]
         border = int(np.floor(significance * (nc.size + 1))) - 1
         if 1 < nc.size < 100:
+            # interpolation needs the fully sorted score array
+            nc = np.sort(nc)[::-1]
             x = np.arange(nc.shape[0])
             interp = interp1d(x, nc)
             nc = interp(np.linspace(0, nc.size - 1, 100))
+            border = min(max(border, 0), nc.size - 1)
+            return np.vstack([nc[border], nc[border]])
         border = min(max(border, 0), nc.size - 1)
-        return np.vstack([nc[border], nc[border]])
+        kth = nc.size - 1 - border
+        quantile = np.partition(nc, kth)[kth]
+        return np.vstack([quantile, quantile])
 
 
 class SignErrorErrFunc(RegressionErrFunc):
@@ -206,13 +209,15 @@ class SignErrorErrFunc(RegressionErrFunc):
         return (prediction - y)
 
     def apply_inverse(self, nc, significance):
-        nc = np.sort(nc)[::-1]
         upper = int(np.floor((significance / 2) * (nc.size + 1)))
         lower = int(np.floor((1 - significance / 2) * (nc.size + 1)))
         # TODO: should probably warn against too few calibration examples
         upper = min(max(upper, 0), nc.size - 1)
         lower = max(min(lower, nc.size - 1), 0)
-        return np.vstack([-nc[lower], nc[upper]])
+        # two O(n) partial selections replace the descending full sort
+        upper_val = np.partition(nc, nc.size - 1 - upper)[nc.size - 1 - upper]
+        lower_val = np.partition(nc, nc.size - 1 - lower)[nc.size - 1 - lower]
+        return np.vstack([-lower_val, upper_val])
 
 
 # -----------------------------------------------------------------------------
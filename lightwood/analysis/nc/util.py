@@ -13,6 +13,15 @@ def t_softmax(x, t=1.0, axis=1):
     return softmax(torch.Tensor(x) / t, dim=axis).numpy()
 
 
+def to_icp_matrix(df: pd.DataFrame) -> np.ndarray:
+    """ Feature matrix handed to nonconformist. Fully numeric frames are packed into a
+    contiguous float32 buffer (object arrays force scalar boxing downstream); frames
+    with non-numeric columns keep the usual `values` accessor. """
+    if all(np.issubdtype(dt, np.number) for dt in df.dtypes):
+        return np.ascontiguousarray(df.to_numpy(dtype=np.float32))
+    return df.values
+
+
 def clean_df(df, target, is_classification, label_encoders):
     """ Returns cleaned DF for nonconformist calibration """
     # @TODO: reevaluate whether this can be streamlined
@@ -60,7 +69,7 @@ def set_conf_range(
     if target_type in (dtype.integer, dtype.float, dtype.num_array, dtype.num_tsarray, dtype.quantity):
 
         # ICP gets all possible bounds (shape: (B, 2, 99))
-        all_ranges = icp.predict(X.values)
+        all_ranges = icp.predict(to_icp_matrix(X))
 
         # iterate over confidence levels until spread >= a multiplier of the dataset stddev
         if significance is not None:
@@ -86,7 +95,7 @@ def set_conf_range(
 
     # categorical
     elif target_type in (dtype.binary, dtype.categorical, dtype.cat_array, dtype.cat_tsarray):
-        pvals = icp.predict(X.values)  # p-values at which each class is included in the predicted set
+        pvals = icp.predict(to_icp_matrix(X))  # p-values at which each class is included in the predicted set
         conf = get_categorical_conf(pvals)
         return conf, pvals
 
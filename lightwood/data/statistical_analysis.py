@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 import pandas as pd
 import numpy as np
@@ -44,12 +46,18 @@ def get_numeric_histogram(data: pd.Series, data_dtype: dtype, bins: int) -> Dict
             new_data.extend(arr)
         data = new_data
 
-    data = [_clean_float(x) for x in data]
+    data = np.asarray([_clean_float(x) for x in data], dtype=np.float64)
 
-    Y, X = np.histogram(data, bins=min(bins, len(set(data))),
-                        range=(min(data), max(data)), density=False)
+    bins = min(bins, len(np.unique(data)))
     if data_dtype == dtype.integer:
-        Y, X = np.histogram(data, bins=[int(round(x)) for x in X], density=False)
+        # integer-rounded edges are computed upfront so the histogram is built in a single pass
+        edges = np.unique(np.round(np.linspace(data.min(), data.max(), bins + 1)).astype(np.int64))
+        if len(edges) < 2:
+            # constant columns collapse to a single edge; keep one populated bucket
+            edges = np.array([edges[0], edges[0] + 1])
+        Y, X = np.histogram(data, bins=edges, density=False)
+    else:
+        Y, X = np.histogram(data, bins=bins, range=(data.min(), data.max()), density=False)
 
     X = X[:-1].tolist()
     Y = Y.tolist()
@@ -111,34 +119,38 @@ def statistical_analysis(data: pd.DataFrame,
     else:
         df_std = 1.0
 
-    histograms = {}
-    buckets = {}
-    # Get histograms for each column
-    for col in columns:
-        histograms[col] = None
-        buckets[col] = None
+    def get_histogram_and_bucket(col):
         if dtypes[col] in (dtype.categorical, dtype.binary, dtype.tags):
             hist = dict(df[col].value_counts())
-            histograms[col] = {
+            histogram = {
                 'x': list([str(x) for x in hist.keys()]),
                 'y': list(hist.values())
             }
-            buckets[col] = histograms[col]['x']
+            return histogram, histogram['x']
         elif dtypes[col] in (dtype.integer, dtype.float, dtype.num_tsarray, dtype.quantity):
-            histograms[col] = get_numeric_histogram(filter_nan_and_none(df[col]), dtypes[col], 50)
-            buckets[col] = histograms[col]['x']
+            histogram = get_numeric_histogram(filter_nan_and_none(df[col]), dtypes[col], 50)
+            return histogram, histogram['x']
         elif dtypes[col] in (dtype.date, dtype.datetime):
-            histograms[col] = get_datetime_histogram(filter_nan_and_none(df[col]), 50)
+            return get_datetime_histogram(filter_nan_and_none(df[col]), 50), None
         # @TODO: case for num_ and cat_ arrays
         else:
-            histograms[col] = {'x': ['Unknown'], 'y': [len(df[col])]}
-            buckets[col] = []
+            return {'x': ['Unknown'], 'y': [len(df[col])]}, []
+
+    # per-column histograms are independent and mostly GIL-releasing numpy/pandas work,
+    # so they are computed in a thread pool
+    histograms = {}
+    buckets = {}
+    if columns:
+        with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as executor:
+            for col, (histogram, bucket) in zip(columns, executor.map(get_histogram_and_bucket, columns)):
+                histograms[col] = histogram
+                buckets[col] = bucket
 
     # get observed classes, used in analysis
     target_class_distribution = None
     target_weights = None
     if dtypes[target] in (dtype.categorical, dtype.binary, dtype.cat_tsarray):
-        target_class_distribution = dict(df[target].value_counts().apply(lambda x: x / len(df[target])))
+        target_class_distribution = (df[target].value_counts() / len(df[target])).to_dict()
         target_weights = {}
         for k in target_class_distribution:
             target_weights[k] = 1 / target_class_distribution[k]
@@ -3,6 +3,7 @@ from typing import Dict, List, Iterable, Tuple
 
 import torch
 import numpy as np
+import pandas as pd
 from scipy.special import softmax
 
 from lightwood.helpers.log import log
@@ -48,6 +49,8 @@ class OneHotEncoder(BaseEncoder):
         super().__init__(is_target)
         self.map = None  # category name -> index
         self.rev_map = None  # index -> category name
+        self._categories = None  # category names, in map order
+        self._category_idxs = None  # index of each category, in map order
         self.use_unknown = use_unknown
 
         # Weight-balance info if encoder represents target
@@ -80,6 +83,10 @@ class OneHotEncoder(BaseEncoder):
         # Set the length of output
         self.output_size = len(self.map)
 
+        # cached category list and index array for vectorized encoding
+        self._categories = list(self.map.keys())
+        self._category_idxs = np.fromiter(self.map.values(), dtype=np.int64)
+
         # For target-only, report on relative weights of classes
         # Each dimension of the inv_target_weights respects `map`
         if self.is_target:
@@ -117,18 +124,18 @@ class OneHotEncoder(BaseEncoder):
                 'You need to call "prepare" before calling "encode" or "decode".'
             )
 
-        ret = torch.zeros(size=(len(column_data), self.output_size))
-
-        for idx, word in enumerate(column_data):
-            index = self.map.get(word, None)
-
-            if index is not None:
-                ret[idx, index] = 1
+        # categorical codes are positions in the category list, computed in a single
+        # C pass; remap them to the encoder's own indices and flag unknowns
+        unk_idx = 0 if self.use_unknown else -1
+        codes = pd.Categorical(column_data, categories=self._categories).codes
+        idxs = np.where(codes >= 0, self._category_idxs[codes], unk_idx)
 
-            if self.use_unknown and index is None:
-                ret[idx, 0] = 1
+        # single scatter into a preallocated buffer; rows flagged with -1 stay all 0s
+        ret = np.zeros((len(idxs), self.output_size), dtype=np.float32)
+        known = idxs >= 0
+        ret[np.flatnonzero(known), idxs[known]] = 1
 
-        return torch.Tensor(ret)
+        return torch.from_numpy(ret)
 
     def decode(self, encoded_data: torch.Tensor):
         """
@@ -137,18 +144,19 @@ class OneHotEncoder(BaseEncoder):
         :param: encoded_data:
         :returns Returns the original category names for encoded data.
         """ # noqa
-        encoded_data_list = encoded_data.tolist()
-        ret = []
+        if not torch.is_tensor(encoded_data):
+            encoded_data = torch.as_tensor(encoded_data)
 
-        for vector in encoded_data_list:
+        # one C-level reduction instead of a Python max per row
+        max_idxs = torch.argmax(encoded_data, dim=1).tolist()
 
-            all_zeros = not np.any(vector)
-            if not self.use_unknown and all_zeros:
-                ret.append(_UNCOMMON_WORD)
-            else:
-                ret.append(self.rev_map[np.argmax(vector)])
+        if self.use_unknown:
+            return [self.rev_map[idx] for idx in max_idxs]
 
-        return ret
+        # without an unknown dimension, all-zero rows decode to the unknown token
+        all_zeros = (encoded_data == 0).all(dim=1).tolist()
+        return [_UNCOMMON_WORD if zero else self.rev_map[idx]
+                for idx, zero in zip(max_idxs, all_zeros)]
 
     def decode_probabilities(self, encoded_data: torch.Tensor) -> Tuple[List[str], List[List[float]], Dict[int, str]]:
         """
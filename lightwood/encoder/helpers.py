@@ -13,7 +13,12 @@ class MinMaxNormalizer:
     def prepare(self, x: np.ndarray) -> None:
         # @TODO: streamline input type
         if isinstance(x[0], list):
-            x = np.vstack(x)
+            # regular-shaped input collapses into one C-level conversion (vstack allocates
+            # per row); ragged series are flattened into a single column instead
+            if len({len(i) for i in x}) == 1:
+                x = np.asarray(x)
+            else:
+                x = np.concatenate([np.asarray(i, dtype=float).ravel() for i in x])[:, None]
         if isinstance(x[0], torch.Tensor):
             x = torch.stack(x).numpy()
         if len(x.shape) < 2:
@@ -34,8 +39,9 @@ class MinMaxNormalizer:
 
         shape = y.shape
         y = y.astype(float).reshape(-1, self.scaler.n_features_in_)
-        out = torch.reshape(torch.Tensor(self.scaler.transform(y)), shape)
-        return out
+        # cast to float32 before the tensor wrap: halves memory and makes from_numpy zero-copy
+        scaled = self.scaler.transform(y).astype(np.float32, copy=False)
+        return torch.from_numpy(scaled).reshape(shape)
 
     def decode(self, y):
         return self.scaler.inverse_transform(y)
@@ -60,17 +66,17 @@ class CatNormalizer:
         self.output_size = len(self.scaler.categories_[0]) if self.encoder_class == 'one_hot' else 1
 
     def encode(self, Y):
-        y = [[str(j) if j is not None else self.unk for j in i] for i in Y]
-        y = [[j if j in self.scaler.categories_[0] else self.unk for j in i] for i in y]
-        y = np.array(y)
-        out = []
-        for i in y:
-            transformed = self.scaler.transform(i.reshape(-1, 1))
-            if isinstance(self.scaler, OrdinalEncoder):
-                transformed = transformed.flatten()
-            out.append(transformed)
+        y = np.array([[str(j) if j is not None else self.unk for j in i] for i in Y])
+        y = np.where(np.isin(y, self.scaler.categories_[0]), y, self.unk)
 
-        return torch.Tensor(out)
+        # flatten the batch so the fitted encoder runs once, then restore the sequence shape
+        transformed = self.scaler.transform(y.reshape(-1, 1))
+        if isinstance(self.scaler, OrdinalEncoder):
+            out = transformed.reshape(y.shape)
+        else:
+            out = transformed.reshape(y.shape[0], y.shape[1], -1)
+
+        return torch.from_numpy(out.astype(np.float32, copy=False))
 
     def decode(self, y):
         return self.scaler.inverse_transform(y)
@@ -1,7 +1,8 @@
-from itertools import product
+import numpy as np
+import pandas as pd
+
 from lightwood.api.dtype import dtype
 from lightwood.encoder.helpers import MinMaxNormalizer, CatNormalizer
-from lightwood.helpers.general import get_group_matches
 
 
 def generate_target_group_normalizers(data):
@@ -25,14 +26,28 @@ def generate_target_group_normalizers(data):
         if data['original_type'] == dtype.num_tsarray:
             data['data'] = data['data'].reshape(-1, 1).astype(float)
 
-        all_group_combinations = list(product(*[set(x) for x in data['group_info'].values()]))
+        if isinstance(data['data'], pd.Series):
+            data['data'] = np.vstack(data['data'])
+        if isinstance(data['data'], np.ndarray) and len(data['data'].shape) < 2:
+            data['data'] = np.expand_dims(data['data'], axis=1)
+        target_data = np.array(data['data'])
+
+        # a single hashed groupby pass yields row indices for every observed
+        # combination, instead of one full column scan per combination
+        gi_df = pd.DataFrame(data['group_info'])
+        group_idxs = gi_df.groupby(list(gi_df.columns), sort=False).indices if len(gi_df.columns) > 0 else {}
+
+        # observed combinations only; the Cartesian product of all grouping values is
+        # mostly empty groups, which would be skipped after a wasted lookup anyway
+        all_group_combinations = list(gi_df.drop_duplicates().itertuples(index=False, name=None))
         for combination in all_group_combinations:
             if combination != ():
-                combination = frozenset(combination)  # freeze so that we can hash with it
-                _, subset = get_group_matches(data, combination)
-                if subset.size > 0:
+                lookup = combination if len(combination) > 1 else combination[0]
+                idxs = group_idxs.get(lookup, [])
+                if len(idxs) > 0:
+                    combination = frozenset(combination)  # freeze so that we can hash with it
                     normalizers[combination] = MinMaxNormalizer(combination=combination)
-                    normalizers[combination].prepare(subset)
+                    normalizers[combination].prepare(target_data[idxs, :])
                     group_combinations.append(combination)
 
         # ...plus a default one, used at inference time and fitted with all training data
@@ -23,16 +23,16 @@ def get_group_matches(data, combination):
         idxs = range(len(data['data']))
         return [idxs, np.array(data['data'])[idxs, :]]  # return all data
     else:
-        all_sets = []
-        for val, key in zip(combination, keys):
-            all_sets.append(set([i for i, elt in enumerate(data['group_info'][key]) if elt == val]))
-        if all_sets:
-            idxs = list(set.intersection(*all_sets))
-            return idxs, np.array(data['data'])[idxs, :]
-
-        else:
+        if len(combination) == 0 or len(keys) == 0:
             return [], np.array([])
 
+        # vectorized equality per key, then a single AND-reduce over all masks
+        mask = np.ones(len(data['data']), dtype=bool)
+        for val, key in zip(combination, keys):
+            mask &= np.asarray(data['group_info'][key], dtype=object) == val
+        idxs = np.flatnonzero(mask).tolist()
+        return idxs, np.array(data['data'])[idxs, :]
+
 
 # ------------------------- #
 # Accuracy metrics
@@ -1,6 +1,5 @@
 import functools
 import torch
-from torch.nn.functional import pad
 from lightwood.helpers.device import get_devices
 
 
@@ -9,18 +8,25 @@ def concat_vectors_and_pad(vec_list, max_):
     assert len(vec_list) <= max_
     assert max_ > 0
 
-    cat_vec = torch.cat(list(vec_list), dim=0)
+    # the output size is known upfront, so one zeroed buffer plus slice copies
+    # replaces the cat-then-pad pair of allocations
+    d = vec_list[0].size(0)
+    out = torch.zeros(max_ * d, dtype=vec_list[0].dtype, device=vec_list[0].device)
+    offset = 0
+    for vec in vec_list:
+        out[offset:offset + vec.size(0)].copy_(vec)
+        offset += vec.size(0)
 
-    pad_size = max_ - len(vec_list)
-    padding = (0, pad_size * vec_list[0].size(0))
-    padded = pad(cat_vec[None], padding, 'constant', 0)[0]
-
-    return padded
+    return out
 
 
 def average_vectors(vec_list):
     assert len(vec_list) > 0
-    return torch.cat([emb[None] for emb in vec_list], dim=0).mean(0)
+    # running in-place sum instead of stacking an (N, D) tensor only to reduce it
+    avg = vec_list[0].clone()
+    for vec in vec_list[1:]:
+        avg.add_(vec)
+    return avg.div_(len(vec_list))
 
 
 class LightwoodAutocast:
@@ -47,13 +53,17 @@ class LightwoodAutocast:
                 self._enabled = False  # gpu is available but cpu is forced
 
         self.prev = self._enabled  # necessary reference to exit
-        LightwoodAutocast.active = self._enabled
 
     def __enter__(self):
         if self._enabled:
             self.prev = torch.is_autocast_enabled()
             torch.set_autocast_enabled(self._enabled)
             torch.autocast_increment_nesting()
+        # the flag only holds while inside the context, so callers can branch on
+        # it to pick the GradScaler path for the current step; save/restore keeps
+        # it truthful across nested contexts (the nets open their own in forward)
+        self._prev_active = LightwoodAutocast.active
+        LightwoodAutocast.active = self._enabled
 
     def __exit__(self, *args):
         if self._enabled:
@@ -61,6 +71,7 @@ class LightwoodAutocast:
             if torch.autocast_decrement_nesting() == 0:
                 torch.clear_autocast_cache()
             torch.set_autocast_enabled(self.prev)
+        LightwoodAutocast.active = self._prev_active
         return False
 
     def __call__(self, func):
@@ -18,7 +18,8 @@ class ArNet(DefaultNet):
                  shape: list = None,
                  max_params: int = 3e7,
                  num_hidden: int = 1,
-                 dropout: float = 0) -> None:
+                 dropout: float = 0,
+                 checkpoint: bool = False) -> None:
 
         self.ar_net = None
         super().__init__(input_size=input_size,
@@ -26,7 +27,8 @@ class ArNet(DefaultNet):
                          shape=shape,
                          max_params=max_params,
                          num_hidden=num_hidden,
-                         dropout=dropout
+                         dropout=dropout,
+                         checkpoint=checkpoint
                          )
         self.target = target_name
         self.encoder_span = encoder_span
@@ -47,7 +49,7 @@ class ArNet(DefaultNet):
             if len(input.shape) == 1:
                 input = input.unsqueeze(0)
 
-            residual_output = self.net(input)
+            residual_output = self._run_net(input)
             ar_output = self.ar_net(input[:, self.ar_idxs])
             if self.ar_net.training:
                 self.ar_net._modules['0'].weight = nn.Parameter(torch.clamp(self.ar_net._modules['0'].weight,
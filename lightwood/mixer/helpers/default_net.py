@@ -1,5 +1,6 @@
 import math
 import torch
+import torch.utils.checkpoint
 from lightwood.helpers.torch import LightwoodAutocast
 from lightwood.helpers.device import get_devices
 from lightwood.helpers.log import log
@@ -19,9 +20,13 @@ class DefaultNet(torch.nn.Module):
                  shape: list = None,
                  max_params: int = int(3e7),
                  num_hidden: int = 1,
-                 dropout: float = 0) -> None:
+                 dropout: float = 0,
+                 checkpoint: bool = False) -> None:
 
         super(DefaultNet, self).__init__()
+        # checkpointing a single hidden layer is pure recompute loss, so it only
+        # kicks in for deeper configurations
+        self.checkpoint = checkpoint and num_hidden >= 2
         if input_size is not None and output_size is not None:
             self.input_size = input_size
             self.output_size = output_size
@@ -60,10 +65,19 @@ class DefaultNet(torch.nn.Module):
         self.device = device
         return self
 
+    def _run_net(self, input):
+        if self.checkpoint and self.training and torch.is_grad_enabled():
+            if not input.requires_grad:
+                # reentrant checkpointing drops parameter gradients unless at
+                # least one input tracks them
+                input = input.detach().requires_grad_(True)
+            return torch.utils.checkpoint.checkpoint(self.net, input)
+        return self.net(input)
+
     def forward(self, input):
         try:
             with LightwoodAutocast():
-                output = self.net(input)
+                output = self._run_net(input)
         except Exception:
-            output = self.net(input)
+            output = self._run_net(input)
         return output